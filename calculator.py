@@ -6,13 +6,29 @@ and calculates both linear and circumferential body measurements.
 """
 
 import math
-from typing import Dict, Tuple, Optional
+from typing import Dict, Mapping, Tuple, Optional
 
+import numpy as np
 
+try:
+    from numba import njit
+except ImportError:
+    # Numba is an optional accelerator; without it the scalar kernels below
+    # simply run interpreted.
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+
+@njit(cache=True, fastmath=True)
 def euclidean_distance(p1: Tuple[float, float], p2: Tuple[float, float]) -> float:
     """
     Calculate Euclidean distance between two points.
 
+    Kept for scalar callers; the measurement pipeline itself resolves all
+    distances in one vectorized pass (see _pair_distances).
+
     Args:
         p1: First point as (x, y) tuple
         p2: Second point as (x, y) tuple
@@ -20,9 +36,10 @@ def euclidean_distance(p1: Tuple[float, float], p2: Tuple[float, float]) -> floa
     Returns:
         Distance in pixels
     """
-    return math.sqrt((p2[0] - p1[0]) ** 2 + (p2[1] - p1[1]) ** 2)
+    return math.hypot(p2[0] - p1[0], p2[1] - p1[1])
 
 
+@njit(cache=True, fastmath=True)
 def ramanujan_ellipse_circumference(a: float, b: float) -> float:
     """
     Calculate ellipse circumference using Ramanujan's second approximation.
@@ -36,13 +53,117 @@ def ramanujan_ellipse_circumference(a: float, b: float) -> float:
     Returns:
         Approximate circumference
     """
-    h = ((a - b) ** 2) / ((a + b) ** 2)
+    # Near-circle fast path: as a -> b the formula collapses to the circle
+    # circumference 2*pi*r with r = (a+b)/2, so skip the sqrt entirely
+    s = a + b
+    if s and abs(a - b) < 1e-3 * s:
+        return math.pi * s
+
     # Ramanujan's second approximation
-    circumference = math.pi * (3 * (a + b) - math.sqrt((3 * a + b) * (a + 3 * b)))
+    circumference = math.pi * (3 * s - math.sqrt((3 * a + b) * (a + 3 * b)))
     return circumference
 
 
-def calibrate_pixel_to_cm(front_landmarks: Dict[str, Tuple[float, float]],
+def ramanujan_ellipse_circumference_batch(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Vectorized Ramanujan circumference for a batch of ellipses.
+
+    Args:
+        a: Array of first semi-axes
+        b: Array of second semi-axes
+
+    Returns:
+        Array of approximate circumferences, one per (a, b) pair
+    """
+    return math.pi * (3 * (a + b) - np.sqrt((3 * a + b) * (a + 3 * b)))
+
+
+# ============================================================================
+# STRUCTURE-OF-ARRAYS LANDMARK TABLES
+# ============================================================================
+
+# Landmark pairs whose straight-line distances feed the measurements below.
+# Keeping them in one table lets calculate_all_measurements() resolve every
+# distance with a single vectorized np.linalg.norm call instead of dozens of
+# interpreted euclidean_distance() calls.
+#
+# 'CROTCH' is a synthetic point (hip midpoint in x, lower hip in y) appended
+# to the front-view array before the distances are computed.
+_FRONT_PAIRS = (
+    ('LEFT_SHOULDER', 'RIGHT_SHOULDER'),
+    ('LEFT_SHOULDER', 'LEFT_ELBOW'),
+    ('LEFT_ELBOW', 'LEFT_WRIST'),
+    ('RIGHT_SHOULDER', 'RIGHT_ELBOW'),
+    ('RIGHT_ELBOW', 'RIGHT_WRIST'),
+    ('LEFT_HIP', 'RIGHT_HIP'),
+    ('CROTCH', 'LEFT_ANKLE'),
+    ('CROTCH', 'RIGHT_ANKLE'),
+    ('LEFT_HIP', 'LEFT_ANKLE'),
+    ('RIGHT_HIP', 'RIGHT_ANKLE'),
+    ('LEFT_HIP', 'LEFT_KNEE'),
+    ('RIGHT_HIP', 'RIGHT_KNEE'),
+)
+
+# Row numbers into the front-view distance array, matching _FRONT_PAIRS order.
+(_F_SHOULDER_WIDTH, _F_LEFT_UPPER_ARM, _F_LEFT_FOREARM, _F_RIGHT_UPPER_ARM,
+ _F_RIGHT_FOREARM, _F_HIP_WIDTH, _F_LEFT_INSEAM, _F_RIGHT_INSEAM,
+ _F_LEFT_OUTSEAM, _F_RIGHT_OUTSEAM, _F_LEFT_THIGH, _F_RIGHT_THIGH) = range(12)
+
+_SIDE_PAIRS = (
+    ('LEFT_SHOULDER', 'LEFT_ELBOW'),
+    ('RIGHT_SHOULDER', 'RIGHT_ELBOW'),
+    ('LEFT_HIP', 'LEFT_KNEE'),
+    ('RIGHT_HIP', 'RIGHT_KNEE'),
+)
+
+# Row numbers into the side-view distance array, matching _SIDE_PAIRS order.
+(_S_LEFT_UPPER_ARM, _S_RIGHT_UPPER_ARM,
+ _S_LEFT_THIGH, _S_RIGHT_THIGH) = range(4)
+
+
+def _to_soa(landmarks: Mapping[str, Tuple[float, float]]) -> Tuple[np.ndarray, Mapping[str, int]]:
+    """
+    Convert a landmark dictionary to a structure-of-arrays representation.
+
+    Args:
+        landmarks: Mapping of landmark names to (x, y) coordinates
+            (a Landmarks object from image_processor or a plain dict)
+
+    Returns:
+        Tuple of (coords, index) where coords is an (N, 2) float32 array and
+        index maps each landmark name to its row in coords
+    """
+    # Landmarks objects from image_processor already carry the array and
+    # the shared name-to-row table; only plain dicts need converting. The
+    # returned index must be treated as read-only - callers that extend it
+    # (e.g. with the synthetic crotch point) copy first.
+    coords = getattr(landmarks, 'coords', None)
+    if coords is not None:
+        return coords, landmarks.index
+    coords = np.asarray(list(landmarks.values()), dtype=np.float32)
+    index = {name: i for i, name in enumerate(landmarks)}
+    return coords, index
+
+
+def _pair_distances(coords: np.ndarray, index: Dict[str, int],
+                    pairs: Tuple[Tuple[str, str], ...]) -> np.ndarray:
+    """
+    Compute the distance for every (name, name) pair in one broadcast.
+
+    Args:
+        coords: (N, 2) array of landmark coordinates
+        index: Mapping from landmark name to row in coords
+        pairs: Sequence of (name_a, name_b) landmark pairs
+
+    Returns:
+        Array of distances, one per pair, in the same order as pairs
+    """
+    idx_a = np.array([index[a] for a, _ in pairs])
+    idx_b = np.array([index[b] for _, b in pairs])
+    return np.linalg.norm(coords[idx_a] - coords[idx_b], axis=1)
+
+
+def calibrate_pixel_to_cm(front_landmarks: Mapping[str, Tuple[float, float]],
                           user_height_cm: float) -> float:
     """
     Calculate the pixel-to-cm ratio using the user's known height.
@@ -67,17 +188,11 @@ def calibrate_pixel_to_cm(front_landmarks: Dict[str, Tuple[float, float]],
     if user_height_cm <= 0:
         raise ValueError(f"Invalid height: {user_height_cm}. Height must be positive.")
 
-    # Find the highest and lowest points in the image
-    # Typically: highest = top of head (NOSE or between eyes), lowest = feet (ANKLE)
-    y_coordinates = [coord[1] for coord in front_landmarks.values()]
-
-    if not y_coordinates:
-        raise ValueError("No y-coordinates found in landmarks")
-
-    min_y = min(y_coordinates)  # Top of body (lowest y-value)
-    max_y = max(y_coordinates)  # Bottom of body (highest y-value)
-
-    height_in_pixels = max_y - min_y
+    # Find the vertical extent between the highest and lowest points
+    # (typically top of head and feet) with one min-max pass over the
+    # y column of the SoA array
+    front_xy, _ = _to_soa(front_landmarks)
+    height_in_pixels = float(np.ptp(front_xy[:, 1]))
 
     if height_in_pixels <= 0:
         raise ValueError(f"Invalid height in pixels: {height_in_pixels}")
@@ -91,374 +206,131 @@ def calibrate_pixel_to_cm(front_landmarks: Dict[str, Tuple[float, float]],
 # LINEAR MEASUREMENTS (from front photo)
 # ============================================================================
 
-def calculate_shoulder_width(front_landmarks: Dict[str, Tuple[float, float]],
-                             pixel_to_cm: float) -> float:
+def calculate_shoulder_width(front_cm: np.ndarray) -> float:
     """
     Calculate shoulder width from left to right shoulder.
 
     Args:
-        front_landmarks: Dictionary of landmark coordinates from front photo
-        pixel_to_cm: Pixel-to-cm conversion ratio
+        front_cm: Front-view pair distances in centimeters (_FRONT_PAIRS order)
 
     Returns:
         Shoulder width in centimeters
     """
-    left_shoulder = front_landmarks['LEFT_SHOULDER']
-    right_shoulder = front_landmarks['RIGHT_SHOULDER']
-
-    distance_px = euclidean_distance(left_shoulder, right_shoulder)
-    return distance_px * pixel_to_cm
+    return float(front_cm[_F_SHOULDER_WIDTH])
 
 
-def calculate_sleeve_length(front_landmarks: Dict[str, Tuple[float, float]],
-                            pixel_to_cm: float,
-                            side: str = 'LEFT') -> float:
+def calculate_sleeve_length(front_cm: np.ndarray, side: str = 'LEFT') -> float:
     """
     Calculate sleeve length from shoulder to wrist.
 
     Path: shoulder → elbow → wrist
 
     Args:
-        front_landmarks: Dictionary of landmark coordinates from front photo
-        pixel_to_cm: Pixel-to-cm conversion ratio
+        front_cm: Front-view pair distances in centimeters (_FRONT_PAIRS order)
         side: 'LEFT' or 'RIGHT'
 
     Returns:
         Sleeve length in centimeters
     """
-    shoulder = front_landmarks[f'{side}_SHOULDER']
-    elbow = front_landmarks[f'{side}_ELBOW']
-    wrist = front_landmarks[f'{side}_WRIST']
+    if side == 'LEFT':
+        return float(front_cm[_F_LEFT_UPPER_ARM] + front_cm[_F_LEFT_FOREARM])
+    return float(front_cm[_F_RIGHT_UPPER_ARM] + front_cm[_F_RIGHT_FOREARM])
 
-    # Calculate distances along the arm
-    shoulder_to_elbow = euclidean_distance(shoulder, elbow)
-    elbow_to_wrist = euclidean_distance(elbow, wrist)
 
-    total_length_px = shoulder_to_elbow + elbow_to_wrist
-    return total_length_px * pixel_to_cm
-
-
-def calculate_inseam(front_landmarks: Dict[str, Tuple[float, float]],
-                     pixel_to_cm: float) -> float:
+def calculate_inseam(front_cm: np.ndarray) -> float:
     """
     Calculate inseam length from crotch to ankle.
 
     Uses average of left and right legs for better accuracy.
 
     Args:
-        front_landmarks: Dictionary of landmark coordinates from front photo
-        pixel_to_cm: Pixel-to-cm conversion ratio
+        front_cm: Front-view pair distances in centimeters (_FRONT_PAIRS order)
 
     Returns:
         Inseam length in centimeters
     """
-    # Use hip landmarks as proxy for crotch
-    left_hip = front_landmarks['LEFT_HIP']
-    right_hip = front_landmarks['RIGHT_HIP']
-    crotch_x = (left_hip[0] + right_hip[0]) / 2
-    crotch_y = max(left_hip[1], right_hip[1])  # Lower of the two hips
-    crotch = (crotch_x, crotch_y)
+    return float(front_cm[_F_LEFT_INSEAM] + front_cm[_F_RIGHT_INSEAM]) / 2
 
-    # Calculate for both legs and average
-    left_ankle = front_landmarks['LEFT_ANKLE']
-    right_ankle = front_landmarks['RIGHT_ANKLE']
 
-    left_inseam_px = euclidean_distance(crotch, left_ankle)
-    right_inseam_px = euclidean_distance(crotch, right_ankle)
-
-    avg_inseam_px = (left_inseam_px + right_inseam_px) / 2
-    return avg_inseam_px * pixel_to_cm
-
-
-def calculate_outseam(front_landmarks: Dict[str, Tuple[float, float]],
-                      pixel_to_cm: float) -> float:
+def calculate_outseam(front_cm: np.ndarray) -> float:
     """
     Calculate outseam length from waist to ankle.
 
     Uses average of left and right legs for better accuracy.
 
     Args:
-        front_landmarks: Dictionary of landmark coordinates from front photo
-        pixel_to_cm: Pixel-to-cm conversion ratio
+        front_cm: Front-view pair distances in centimeters (_FRONT_PAIRS order)
 
     Returns:
         Outseam length in centimeters
     """
-    # Use hip landmarks as waist reference
-    left_hip = front_landmarks['LEFT_HIP']
-    right_hip = front_landmarks['RIGHT_HIP']
-
-    left_ankle = front_landmarks['LEFT_ANKLE']
-    right_ankle = front_landmarks['RIGHT_ANKLE']
-
-    left_outseam_px = euclidean_distance(left_hip, left_ankle)
-    right_outseam_px = euclidean_distance(right_hip, right_ankle)
-
-    avg_outseam_px = (left_outseam_px + right_outseam_px) / 2
-    return avg_outseam_px * pixel_to_cm
+    return float(front_cm[_F_LEFT_OUTSEAM] + front_cm[_F_RIGHT_OUTSEAM]) / 2
 
 
 # ============================================================================
 # CIRCUMFERENTIAL MEASUREMENTS (using both front and side photos)
 # ============================================================================
 
-def calculate_neck_circumference(front_landmarks: Dict[str, Tuple[float, float]],
-                                 side_landmarks: Dict[str, Tuple[float, float]],
-                                 pixel_to_cm: float) -> float:
-    """
-    Calculate neck circumference using ellipse approximation.
-
-    Args:
-        front_landmarks: Dictionary of landmark coordinates from front photo
-        side_landmarks: Dictionary of landmark coordinates from side photo
-        pixel_to_cm: Pixel-to-cm conversion ratio
-
-    Returns:
-        Neck circumference in centimeters
-    """
-    # Width: distance between left and right shoulders divided by factor
-    # (neck is narrower than shoulders)
-    left_shoulder_front = front_landmarks['LEFT_SHOULDER']
-    right_shoulder_front = front_landmarks['RIGHT_SHOULDER']
-    shoulder_width_px = euclidean_distance(left_shoulder_front, right_shoulder_front)
-
-    # Approximate neck width as ~30% of shoulder width
-    neck_width_px = shoulder_width_px * 0.30
-
-    # Depth: use shoulder positions from side view
-    # Find the front-most and back-most shoulder points
-    left_shoulder_side = side_landmarks['LEFT_SHOULDER']
-    right_shoulder_side = side_landmarks['RIGHT_SHOULDER']
-
-    # In side view, x-coordinate represents depth
-    x_coords = [left_shoulder_side[0], right_shoulder_side[0]]
-    neck_depth_px = (max(x_coords) - min(x_coords)) * 0.30  # Approximate neck depth
-
-    # If depth is too small, use a ratio of width
-    if neck_depth_px < neck_width_px * 0.3:
-        neck_depth_px = neck_width_px * 0.7  # Typical neck depth/width ratio
-
-    # Calculate semi-axes
-    a = (neck_width_px / 2) * pixel_to_cm
-    b = (neck_depth_px / 2) * pixel_to_cm
-
-    return ramanujan_ellipse_circumference(a, b)
-
-
-def calculate_chest_circumference(front_landmarks: Dict[str, Tuple[float, float]],
-                                  side_landmarks: Dict[str, Tuple[float, float]],
-                                  pixel_to_cm: float) -> float:
-    """
-    Calculate chest circumference using ellipse approximation.
-
-    Args:
-        front_landmarks: Dictionary of landmark coordinates from front photo
-        side_landmarks: Dictionary of landmark coordinates from side photo
-        pixel_to_cm: Pixel-to-cm conversion ratio
-
-    Returns:
-        Chest circumference in centimeters
-    """
-    # Width: distance between left and right shoulders (approximately chest level)
-    left_shoulder = front_landmarks['LEFT_SHOULDER']
-    right_shoulder = front_landmarks['RIGHT_SHOULDER']
-    chest_width_px = euclidean_distance(left_shoulder, right_shoulder) * 1.1  # Slightly wider
-
-    # Depth: distance from front to back at shoulder level in side view
-    left_shoulder_side = side_landmarks['LEFT_SHOULDER']
-    right_shoulder_side = side_landmarks['RIGHT_SHOULDER']
-
-    # Use average y-coordinate of shoulders to find chest level
-    chest_y = (left_shoulder_side[1] + right_shoulder_side[1]) / 2
-
-    # In side view, find body extent at chest level
-    # Filter landmarks around chest height (±10% tolerance)
-    tolerance = abs(left_shoulder_side[1] - side_landmarks['LEFT_HIP'][1]) * 0.2
-    chest_level_points = [
-        coord[0] for name, coord in side_landmarks.items()
-        if abs(coord[1] - chest_y) < tolerance
-    ]
-
-    if chest_level_points:
-        chest_depth_px = max(chest_level_points) - min(chest_level_points)
-    else:
-        # Fallback: use shoulder depth
-        chest_depth_px = abs(left_shoulder_side[0] - right_shoulder_side[0])
-
-    # Calculate semi-axes
-    a = (chest_width_px / 2) * pixel_to_cm
-    b = (chest_depth_px / 2) * pixel_to_cm
-
-    return ramanujan_ellipse_circumference(a, b)
-
-
-def calculate_waist_circumference(front_landmarks: Dict[str, Tuple[float, float]],
-                                  side_landmarks: Dict[str, Tuple[float, float]],
-                                  pixel_to_cm: float) -> float:
-    """
-    Calculate waist circumference using ellipse approximation.
-
-    Args:
-        front_landmarks: Dictionary of landmark coordinates from front photo
-        side_landmarks: Dictionary of landmark coordinates from side photo
-        pixel_to_cm: Pixel-to-cm conversion ratio
-
-    Returns:
-        Waist circumference in centimeters
-    """
-    # Width: distance between hips at waist level
-    left_hip = front_landmarks['LEFT_HIP']
-    right_hip = front_landmarks['RIGHT_HIP']
-    waist_width_px = euclidean_distance(left_hip, right_hip)
-
-    # Depth: body thickness at hip level in side view
-    left_hip_side = side_landmarks['LEFT_HIP']
-    right_hip_side = side_landmarks['RIGHT_HIP']
-    waist_y = (left_hip_side[1] + right_hip_side[1]) / 2
-
-    # Find body extent at waist level
-    tolerance = abs(left_hip_side[1] - side_landmarks['LEFT_SHOULDER'][1]) * 0.1
-    waist_level_points = [
-        coord[0] for name, coord in side_landmarks.items()
-        if abs(coord[1] - waist_y) < tolerance
-    ]
-
-    if waist_level_points:
-        waist_depth_px = max(waist_level_points) - min(waist_level_points)
-    else:
-        # Fallback: use hip depth
-        waist_depth_px = abs(left_hip_side[0] - right_hip_side[0])
-
-    # Calculate semi-axes
-    a = (waist_width_px / 2) * pixel_to_cm
-    b = (waist_depth_px / 2) * pixel_to_cm
-
-    return ramanujan_ellipse_circumference(a, b)
-
-
-def calculate_hip_circumference(front_landmarks: Dict[str, Tuple[float, float]],
-                                side_landmarks: Dict[str, Tuple[float, float]],
-                                pixel_to_cm: float) -> float:
+def _torso_depths_px(side_xy: np.ndarray,
+                     side_index: Dict[str, int]) -> Tuple[float, float, float, float]:
     """
-    Calculate hip circumference using ellipse approximation.
+    Body depths at shoulder, chest, waist and hip level in the side view.
 
-    Args:
-        front_landmarks: Dictionary of landmark coordinates from front photo
-        side_landmarks: Dictionary of landmark coordinates from side photo
-        pixel_to_cm: Pixel-to-cm conversion ratio
-
-    Returns:
-        Hip circumference in centimeters
-    """
-    # Width: distance between left and right hips
-    left_hip = front_landmarks['LEFT_HIP']
-    right_hip = front_landmarks['RIGHT_HIP']
-    hip_width_px = euclidean_distance(left_hip, right_hip)
-
-    # Depth: body thickness at hip level in side view
-    left_hip_side = side_landmarks['LEFT_HIP']
-    right_hip_side = side_landmarks['RIGHT_HIP']
-    hip_y = (left_hip_side[1] + right_hip_side[1]) / 2
-
-    # Find body extent at hip level
-    tolerance = abs(left_hip_side[1] - side_landmarks['LEFT_KNEE'][1]) * 0.2
-    hip_level_points = [
-        coord[0] for name, coord in side_landmarks.items()
-        if abs(coord[1] - hip_y) < tolerance
-    ]
-
-    if hip_level_points:
-        hip_depth_px = max(hip_level_points) - min(hip_level_points)
-    else:
-        # Fallback
-        hip_depth_px = abs(left_hip_side[0] - right_hip_side[0])
-
-    # Calculate semi-axes
-    a = (hip_width_px / 2) * pixel_to_cm
-    b = (hip_depth_px / 2) * pixel_to_cm
-
-    return ramanujan_ellipse_circumference(a, b)
-
-
-def calculate_bicep_circumference(front_landmarks: Dict[str, Tuple[float, float]],
-                                  side_landmarks: Dict[str, Tuple[float, float]],
-                                  pixel_to_cm: float,
-                                  side: str = 'LEFT') -> float:
-    """
-    Calculate bicep circumference using ellipse approximation.
+    In the side view the x-coordinate represents depth, so each level's
+    depth is the x-extent of the landmarks whose y falls within a tolerance
+    band around that level. The three bands are evaluated as vectorized
+    boolean masks over the side-view array instead of per-level Python
+    loops; shoulder/hip x-spacing serves as the fallback when a band
+    catches no landmarks.
 
     Args:
-        front_landmarks: Dictionary of landmark coordinates from front photo
-        side_landmarks: Dictionary of landmark coordinates from side photo
-        pixel_to_cm: Pixel-to-cm conversion ratio
-        side: 'LEFT' or 'RIGHT'
+        side_xy: (N, 2) array of side-view landmark coordinates
+        side_index: Mapping from landmark name to row in side_xy
 
     Returns:
-        Bicep circumference in centimeters
+        Tuple of (shoulder, chest, waist, hip) depths in pixels
     """
-    # Width: visible width of upper arm in front view
-    shoulder = front_landmarks[f'{side}_SHOULDER']
-    elbow = front_landmarks[f'{side}_ELBOW']
+    xs = side_xy[:, 0]
+    ys = side_xy[:, 1]
 
-    # Midpoint between shoulder and elbow (bicep location)
-    bicep_x_front = (shoulder[0] + elbow[0]) / 2
-    bicep_y_front = (shoulder[1] + elbow[1]) / 2
+    left_shoulder = side_xy[side_index['LEFT_SHOULDER']]
+    right_shoulder = side_xy[side_index['RIGHT_SHOULDER']]
+    left_hip = side_xy[side_index['LEFT_HIP']]
+    right_hip = side_xy[side_index['RIGHT_HIP']]
+    left_knee = side_xy[side_index['LEFT_KNEE']]
 
-    # Estimate width as a fraction of arm length
-    arm_length_px = euclidean_distance(shoulder, elbow)
-    bicep_width_px = arm_length_px * 0.20  # Typical bicep width relative to upper arm length
+    # Chest level sits at the shoulders, waist and hip at the hip line
+    chest_y = (left_shoulder[1] + right_shoulder[1]) / 2
+    hip_y = (left_hip[1] + right_hip[1]) / 2
 
-    # Depth: use side view
-    shoulder_side = side_landmarks[f'{side}_SHOULDER']
-    elbow_side = side_landmarks[f'{side}_ELBOW']
+    # Shoulder-to-hip vertical span, shared by the chest and waist bands
+    torso_span = abs(float(left_shoulder[1] - left_hip[1]))
 
-    # Estimate depth similarly
-    arm_length_side_px = euclidean_distance(shoulder_side, elbow_side)
-    bicep_depth_px = arm_length_side_px * 0.20
+    shoulder_depth = abs(float(left_shoulder[0] - right_shoulder[0]))
+    hip_depth_fallback = abs(float(left_hip[0] - right_hip[0]))
 
-    # Calculate semi-axes
-    a = (bicep_width_px / 2) * pixel_to_cm
-    b = (bicep_depth_px / 2) * pixel_to_cm
+    levels = (
+        (chest_y, torso_span * 0.2, shoulder_depth),
+        (hip_y, torso_span * 0.1, hip_depth_fallback),
+        (hip_y, abs(float(left_hip[1] - left_knee[1])) * 0.2, hip_depth_fallback),
+    )
 
-    return ramanujan_ellipse_circumference(a, b)
+    depths = [shoulder_depth]
+    for level_y, tolerance, fallback in levels:
+        mask = np.abs(ys - level_y) < tolerance
+        depths.append(float(np.ptp(xs[mask])) if mask.any() else fallback)
 
+    return tuple(depths)
 
-def calculate_thigh_circumference(front_landmarks: Dict[str, Tuple[float, float]],
-                                  side_landmarks: Dict[str, Tuple[float, float]],
-                                  pixel_to_cm: float,
-                                  side: str = 'LEFT') -> float:
-    """
-    Calculate thigh circumference using ellipse approximation.
 
-    Args:
-        front_landmarks: Dictionary of landmark coordinates from front photo
-        side_landmarks: Dictionary of landmark coordinates from side photo
-        pixel_to_cm: Pixel-to-cm conversion ratio
-        side: 'LEFT' or 'RIGHT'
-
-    Returns:
-        Thigh circumference in centimeters
-    """
-    # Width: visible width of thigh in front view
-    hip = front_landmarks[f'{side}_HIP']
-    knee = front_landmarks[f'{side}_KNEE']
-
-    # Use distance slightly below hip as thigh width
-    thigh_length_px = euclidean_distance(hip, knee)
-    thigh_width_px = thigh_length_px * 0.25  # Typical thigh width relative to length
-
-    # Depth: use side view
-    hip_side = side_landmarks[f'{side}_HIP']
-    knee_side = side_landmarks[f'{side}_KNEE']
+# Rows of the front-view distance array holding the four limb lengths, in the
+# same order as _SIDE_PAIRS (left/right upper arm, left/right thigh)
+_F_LIMB_ROWS = (_F_LEFT_UPPER_ARM, _F_RIGHT_UPPER_ARM,
+                _F_LEFT_THIGH, _F_RIGHT_THIGH)
 
-    thigh_length_side_px = euclidean_distance(hip_side, knee_side)
-    thigh_depth_px = thigh_length_side_px * 0.25
-
-    # Calculate semi-axes
-    a = (thigh_width_px / 2) * pixel_to_cm
-    b = (thigh_depth_px / 2) * pixel_to_cm
-
-    return ramanujan_ellipse_circumference(a, b)
+# Semi-axis per unit limb length: biceps span ~20% of upper-arm length and
+# thighs ~25% of thigh length, halved to give the semi-axes directly
+_LIMB_SEMI_AXIS_SCALE = np.array([0.10, 0.10, 0.125, 0.125])
 
 
 # ============================================================================
@@ -466,8 +338,8 @@ def calculate_thigh_circumference(front_landmarks: Dict[str, Tuple[float, float]
 # ============================================================================
 
 def calculate_all_measurements(
-    front_landmarks: Dict[str, Tuple[float, float]],
-    side_landmarks: Dict[str, Tuple[float, float]],
+    front_landmarks: Mapping[str, Tuple[float, float]],
+    side_landmarks: Mapping[str, Tuple[float, float]],
     user_height_cm: float
 ) -> Dict[str, float]:
     """
@@ -487,43 +359,80 @@ def calculate_all_measurements(
     # Calibrate pixel-to-cm ratio using front photo
     pixel_to_cm = calibrate_pixel_to_cm(front_landmarks, user_height_cm)
 
+    # Convert both landmark dicts to structure-of-arrays form
+    front_xy, front_index = _to_soa(front_landmarks)
+    side_xy, side_index = _to_soa(side_landmarks)
+
+    # Append the synthetic crotch point used by the inseam measurement:
+    # midpoint of the hips in x, lower of the two hips in y (the index is
+    # copied since _to_soa may hand back the shared Landmarks table)
+    left_hip = front_xy[front_index['LEFT_HIP']]
+    right_hip = front_xy[front_index['RIGHT_HIP']]
+    crotch = np.array([[(left_hip[0] + right_hip[0]) / 2,
+                        max(left_hip[1], right_hip[1])]], dtype=np.float32)
+    front_index = {**front_index, 'CROTCH': len(front_xy)}
+    front_xy = np.concatenate([front_xy, crotch])
+
+    # Resolve every pair distance in one broadcast per photo, scaled to cm
+    front_cm = _pair_distances(front_xy, front_index, _FRONT_PAIRS) * pixel_to_cm
+    side_cm = _pair_distances(side_xy, side_index, _SIDE_PAIRS) * pixel_to_cm
+
+    # Body depths at the four torso levels, from one masked pass over the
+    # side view
+    shoulder_depth_px, chest_depth_px, waist_depth_px, hip_depth_px = \
+        _torso_depths_px(side_xy, side_index)
+
+    shoulder_width_cm = float(front_cm[_F_SHOULDER_WIDTH])
+    hip_width_cm = float(front_cm[_F_HIP_WIDTH])
+
+    # Neck: ~30% of shoulder width and depth; if the side view gives no
+    # usable depth, fall back to a typical neck depth/width ratio
+    neck_width_cm = shoulder_width_cm * 0.30
+    neck_depth_cm = shoulder_depth_px * 0.30 * pixel_to_cm
+    if neck_depth_cm < neck_width_cm * 0.3:
+        neck_depth_cm = neck_width_cm * 0.7
+
+    # Assemble semi-axes for all eight elliptical cross-sections, then run
+    # the Ramanujan approximation once over the whole batch. The limb
+    # (bicep/thigh) semi-axes come straight from the limb-length rows:
+    # width from the front view, depth from the side view.
+    a_arr = np.concatenate(
+        ([neck_width_cm / 2,
+          shoulder_width_cm * 1.1 / 2,  # Chest sits slightly wider than shoulders
+          hip_width_cm / 2,
+          hip_width_cm / 2],
+         front_cm[list(_F_LIMB_ROWS)] * _LIMB_SEMI_AXIS_SCALE)
+    )
+    b_arr = np.concatenate(
+        ([neck_depth_cm / 2],
+         np.array([chest_depth_px,
+                   waist_depth_px,
+                   hip_depth_px]) * (pixel_to_cm / 2),
+         side_cm * _LIMB_SEMI_AXIS_SCALE)
+    )
+    circumferences = ramanujan_ellipse_circumference_batch(a_arr, b_arr)
+
     # Calculate all measurements
     measurements = {
         # User input
         'height': user_height_cm,
 
         # Linear measurements
-        'shoulder_width': calculate_shoulder_width(front_landmarks, pixel_to_cm),
-        'left_sleeve_length': calculate_sleeve_length(front_landmarks, pixel_to_cm, 'LEFT'),
-        'right_sleeve_length': calculate_sleeve_length(front_landmarks, pixel_to_cm, 'RIGHT'),
-        'inseam': calculate_inseam(front_landmarks, pixel_to_cm),
-        'outseam': calculate_outseam(front_landmarks, pixel_to_cm),
-
-        # Circumferential measurements
-        'neck_circumference': calculate_neck_circumference(
-            front_landmarks, side_landmarks, pixel_to_cm
-        ),
-        'chest_circumference': calculate_chest_circumference(
-            front_landmarks, side_landmarks, pixel_to_cm
-        ),
-        'waist_circumference': calculate_waist_circumference(
-            front_landmarks, side_landmarks, pixel_to_cm
-        ),
-        'hip_circumference': calculate_hip_circumference(
-            front_landmarks, side_landmarks, pixel_to_cm
-        ),
-        'left_bicep_circumference': calculate_bicep_circumference(
-            front_landmarks, side_landmarks, pixel_to_cm, 'LEFT'
-        ),
-        'right_bicep_circumference': calculate_bicep_circumference(
-            front_landmarks, side_landmarks, pixel_to_cm, 'RIGHT'
-        ),
-        'left_thigh_circumference': calculate_thigh_circumference(
-            front_landmarks, side_landmarks, pixel_to_cm, 'LEFT'
-        ),
-        'right_thigh_circumference': calculate_thigh_circumference(
-            front_landmarks, side_landmarks, pixel_to_cm, 'RIGHT'
-        ),
+        'shoulder_width': calculate_shoulder_width(front_cm),
+        'left_sleeve_length': calculate_sleeve_length(front_cm, 'LEFT'),
+        'right_sleeve_length': calculate_sleeve_length(front_cm, 'RIGHT'),
+        'inseam': calculate_inseam(front_cm),
+        'outseam': calculate_outseam(front_cm),
+
+        # Circumferential measurements (batch order above)
+        'neck_circumference': float(circumferences[0]),
+        'chest_circumference': float(circumferences[1]),
+        'waist_circumference': float(circumferences[2]),
+        'hip_circumference': float(circumferences[3]),
+        'left_bicep_circumference': float(circumferences[4]),
+        'right_bicep_circumference': float(circumferences[5]),
+        'left_thigh_circumference': float(circumferences[6]),
+        'right_thigh_circumference': float(circumferences[7]),
     }
 
     return measurements
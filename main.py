@@ -8,6 +8,7 @@ Main entry point for the application.
 
 import sys
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from image_processor import get_landmarks
 from calculator import calculate_all_measurements
 from ui_handler import (
@@ -23,6 +24,157 @@ from ui_handler import (
 )
 
 
+# Maps the --quality CLI flag to a MediaPipe model complexity
+QUALITY_LEVELS = {
+    'fast': 0,
+    'balanced': 1,
+    'accurate': 2,
+}
+
+
+# Guideline hints appended to stage errors
+_FRONT_HINT = (
+    "Please ensure your front view photo follows all guidelines:\n"
+    "  - Full body visible from head to feet\n"
+    "  - Standing in A-pose (arms slightly out)\n"
+    "  - Good lighting and plain background"
+)
+_SIDE_HINT = (
+    "Please ensure your side view photo follows all guidelines:\n"
+    "  - Full body visible from head to feet\n"
+    "  - Standing perpendicular to camera (90° angle)\n"
+    "  - Same pose as front view (A-pose)\n"
+    "  - Good lighting and plain background"
+)
+_CALC_HINT = (
+    "This may indicate an issue with landmark detection.\n"
+    "Please ensure both photos follow all guidelines."
+)
+
+
+def _run_stage(label, fn, *args, hint="", error_title="Processing Error", **kwargs):
+    """
+    Run one pipeline stage with centralized error handling.
+
+    Prints the stage label, runs fn, and on failure shows the error with
+    the stage's guideline hint appended before exiting.
+
+    Args:
+        label: Progress line printed before the stage runs
+        fn: Stage callable
+        hint: Guideline hint appended to expected errors
+        error_title: Title passed to display_error
+
+    Returns:
+        The stage's return value
+    """
+    print(label)
+    try:
+        return fn(*args, **kwargs)
+    except (ValueError, KeyError) as e:
+        message = str(e)
+        if hint:
+            message = f"{message}\n\n{hint}"
+        display_error(message, error_title)
+        sys.exit(1)
+    except Exception as e:
+        display_error(f"Unexpected error:\n{str(e)}")
+        if '--debug' in sys.argv:
+            traceback.print_exc()
+        sys.exit(1)
+
+
+def _model_complexity_from_argv() -> int:
+    """
+    Resolve the optional --quality=<level> flag to a model complexity.
+
+    Returns:
+        MediaPipe model complexity (defaults to 'balanced' / 1)
+    """
+    for arg in sys.argv[1:]:
+        if arg.startswith('--quality='):
+            quality = arg.split('=', 1)[1]
+            if quality not in QUALITY_LEVELS:
+                print(f"Unknown quality level '{quality}'. "
+                      f"Choose from: {', '.join(QUALITY_LEVELS)}")
+                sys.exit(1)
+            return QUALITY_LEVELS[quality]
+    return QUALITY_LEVELS['balanced']
+
+
+def _acquire_inputs():
+    """
+    Show the welcome flow and collect the photo paths and height.
+
+    Returns:
+        Tuple of (front_image_path, side_image_path, height_cm)
+    """
+    display_welcome()
+    display_guidelines()
+
+    if not get_user_consent():
+        print("\nExiting application.")
+        sys.exit(0)
+
+    return collect_inputs()
+
+
+def _detect_landmarks(front_image_path, side_image_path):
+    """
+    Detect landmarks in both photos concurrently.
+
+    MediaPipe releases the GIL during inference, so the two detections
+    overlap on multi-core CPUs; each worker thread gets its own Pose
+    instance.
+
+    Returns:
+        Tuple of (front_landmarks, side_landmarks)
+    """
+    model_complexity = _model_complexity_from_argv()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        front_future = executor.submit(get_landmarks, front_image_path, model_complexity)
+        side_future = executor.submit(get_landmarks, side_image_path, model_complexity)
+
+        front_landmarks = _run_stage(
+            "Step 1/3: Detecting landmarks in front view photo...",
+            front_future.result, hint=_FRONT_HINT
+        )
+        side_landmarks = _run_stage(
+            "Step 2/3: Detecting landmarks in side view photo...",
+            side_future.result, hint=_SIDE_HINT
+        )
+
+    return front_landmarks, side_landmarks
+
+
+def _compute(front_landmarks, side_landmarks, height_cm):
+    """
+    Calculate all measurements from the detected landmarks.
+
+    Returns:
+        Dictionary of measurements in centimeters
+    """
+    measurements = _run_stage(
+        "Step 3/3: Calculating body measurements...",
+        calculate_all_measurements,
+        front_landmarks, side_landmarks, height_cm,
+        hint=_CALC_HINT, error_title="Calculation Error"
+    )
+
+    # One summary line instead of a checkmark per stage
+    print(f"\n  ✓ Detected {len(front_landmarks)} front and "
+          f"{len(side_landmarks)} side landmarks; all measurements calculated")
+
+    return measurements
+
+
+def _output(measurements):
+    """Display the results, offer the export, and close the session."""
+    display_measurements(measurements)
+    export_measurements(measurements)
+    display_completion()
+
+
 def main():
     """
     Main application orchestrator.
@@ -35,111 +187,21 @@ def main():
     5. Calculate measurements
     6. Display results
     7. Optionally export to file
+
+    Each stage function returns only what the next stage needs, so the
+    landmark arrays drop out of scope (and are freed) as soon as the
+    measurements exist - no manual del required.
     """
     try:
-        # Step 1: Welcome and guidelines
-        display_welcome()
-        display_guidelines()
+        front_image_path, side_image_path, height_cm = _acquire_inputs()
 
-        # Step 2: Get user consent
-        if not get_user_consent():
-            print("\nExiting application.")
-            sys.exit(0)
-
-        # Step 3: Collect inputs
-        front_image_path, side_image_path, height_cm = collect_inputs()
-
-        # Step 4: Display processing message
         display_processing()
 
-        # Step 5: Process front image
-        print("Step 1/3: Detecting landmarks in front view photo...")
-        try:
-            front_landmarks = get_landmarks(front_image_path)
-            print(f"  ✓ Successfully detected {len(front_landmarks)} landmarks in front view")
-        except ValueError as e:
-            display_error(
-                f"Failed to process front view photo:\n{str(e)}\n\n"
-                "Please ensure your front view photo follows all guidelines:\n"
-                "  - Full body visible from head to feet\n"
-                "  - Standing in A-pose (arms slightly out)\n"
-                "  - Good lighting and plain background",
-                "Processing Error"
-            )
-            sys.exit(1)
-        except Exception as e:
-            display_error(f"Unexpected error processing front view photo:\n{str(e)}")
-            sys.exit(1)
-
-        # Step 6: Process side image
-        print("\nStep 2/3: Detecting landmarks in side view photo...")
-        try:
-            side_landmarks = get_landmarks(side_image_path)
-            print(f"  ✓ Successfully detected {len(side_landmarks)} landmarks in side view")
-        except ValueError as e:
-            display_error(
-                f"Failed to process side view photo:\n{str(e)}\n\n"
-                "Please ensure your side view photo follows all guidelines:\n"
-                "  - Full body visible from head to feet\n"
-                "  - Standing perpendicular to camera (90° angle)\n"
-                "  - Same pose as front view (A-pose)\n"
-                "  - Good lighting and plain background",
-                "Processing Error"
-            )
-            sys.exit(1)
-        except Exception as e:
-            display_error(f"Unexpected error processing side view photo:\n{str(e)}")
-            sys.exit(1)
-
-        # Step 7: Calculate measurements
-        print("\nStep 3/3: Calculating body measurements...")
-        try:
-            measurements = calculate_all_measurements(
-                front_landmarks,
-                side_landmarks,
-                height_cm
-            )
-            print("  ✓ All measurements calculated successfully")
-        except ValueError as e:
-            display_error(
-                f"Failed to calculate measurements:\n{str(e)}\n\n"
-                "This may indicate an issue with landmark detection.\n"
-                "Please ensure both photos follow all guidelines.",
-                "Calculation Error"
-            )
-            sys.exit(1)
-        except KeyError as e:
-            display_error(
-                f"Missing required landmark: {str(e)}\n\n"
-                "This indicates the body pose was not detected correctly.\n"
-                "Please ensure:\n"
-                "  - You are standing in A-pose (arms slightly away from body)\n"
-                "  - Full body is visible in both photos\n"
-                "  - Photos are clear and well-lit",
-                "Landmark Error"
-            )
-            sys.exit(1)
-        except Exception as e:
-            display_error(f"Unexpected error during calculations:\n{str(e)}")
-            if '--debug' in sys.argv:
-                traceback.print_exc()
-            sys.exit(1)
-
-        # Step 8: Display results
-        display_measurements(measurements)
-
-        # Step 9: Offer to export
-        export_measurements(measurements)
-
-        # Step 10: Completion
-        display_completion()
-
-        # Clean up (explicit memory cleanup)
-        del front_landmarks
-        del side_landmarks
-        del measurements
+        measurements = _compute(
+            *_detect_landmarks(front_image_path, side_image_path), height_cm
+        )
 
-        sys.exit(0)
+        _output(measurements)
 
     except KeyboardInterrupt:
         print("\n\nOperation cancelled by user.")
@@ -13,6 +13,41 @@ from image_processor import get_landmarks
 from calculator import calculate_all_measurements
 
 
+_EQ70 = "=" * 70
+
+# Whole report as one template: a single format_map call renders it without
+# the per-line appends, allocations and re-parsed format specs
+_REPORT_TEMPLATE = f"""
+{_EQ70}
+BODY MEASUREMENTS REPORT
+{_EQ70}
+
+Height: {{height:.1f}} cm
+
+--- Linear Measurements ---
+Shoulder Width:        {{shoulder_width:.1f}} cm
+Left Sleeve Length:    {{left_sleeve_length:.1f}} cm
+Right Sleeve Length:   {{right_sleeve_length:.1f}} cm
+Inseam:                {{inseam:.1f}} cm
+Outseam:               {{outseam:.1f}} cm
+
+--- Circumferential Measurements ---
+Neck Circumference:    {{neck_circumference:.1f}} cm
+Chest Circumference:   {{chest_circumference:.1f}} cm
+Waist Circumference:   {{waist_circumference:.1f}} cm
+Hip Circumference:     {{hip_circumference:.1f}} cm
+Left Bicep Circumference:  {{left_bicep_circumference:.1f}} cm
+Right Bicep Circumference: {{right_bicep_circumference:.1f}} cm
+Left Thigh Circumference:  {{left_thigh_circumference:.1f}} cm
+Right Thigh Circumference: {{right_thigh_circumference:.1f}} cm
+
+{_EQ70}
+DISCLAIMER:
+These measurements are estimates. Accuracy depends on photo quality.
+For best results, follow all guidelines carefully.
+{_EQ70}"""
+
+
 def format_measurements(measurements: dict) -> str:
     """
     Format measurements dictionary into readable output.
@@ -23,41 +58,7 @@ def format_measurements(measurements: dict) -> str:
     Returns:
         Formatted string with all measurements
     """
-    output = []
-    output.append("\n" + "=" * 70)
-    output.append("BODY MEASUREMENTS REPORT")
-    output.append("=" * 70)
-
-    # Basic info
-    output.append(f"\nHeight: {measurements['height']:.1f} cm")
-
-    # Linear measurements
-    output.append("\n--- Linear Measurements ---")
-    output.append(f"Shoulder Width:        {measurements['shoulder_width']:.1f} cm")
-    output.append(f"Left Sleeve Length:    {measurements['left_sleeve_length']:.1f} cm")
-    output.append(f"Right Sleeve Length:   {measurements['right_sleeve_length']:.1f} cm")
-    output.append(f"Inseam:                {measurements['inseam']:.1f} cm")
-    output.append(f"Outseam:               {measurements['outseam']:.1f} cm")
-
-    # Circumferential measurements
-    output.append("\n--- Circumferential Measurements ---")
-    output.append(f"Neck Circumference:    {measurements['neck_circumference']:.1f} cm")
-    output.append(f"Chest Circumference:   {measurements['chest_circumference']:.1f} cm")
-    output.append(f"Waist Circumference:   {measurements['waist_circumference']:.1f} cm")
-    output.append(f"Hip Circumference:     {measurements['hip_circumference']:.1f} cm")
-    output.append(f"Left Bicep Circumference:  {measurements['left_bicep_circumference']:.1f} cm")
-    output.append(f"Right Bicep Circumference: {measurements['right_bicep_circumference']:.1f} cm")
-    output.append(f"Left Thigh Circumference:  {measurements['left_thigh_circumference']:.1f} cm")
-    output.append(f"Right Thigh Circumference: {measurements['right_thigh_circumference']:.1f} cm")
-
-    # Disclaimer
-    output.append("\n" + "=" * 70)
-    output.append("DISCLAIMER:")
-    output.append("These measurements are estimates. Accuracy depends on photo quality.")
-    output.append("For best results, follow all guidelines carefully.")
-    output.append("=" * 70)
-
-    return "\n".join(output)
+    return _REPORT_TEMPLATE.format_map(measurements)
 
 
 def main():
@@ -23,8 +23,8 @@ def main():
         print(f"Processing image: {image_path}")
         print("-" * 60)
 
-        # Get landmarks
-        landmarks = get_landmarks(image_path)
+        # Get landmarks (keep the decoded image for the visualization below)
+        landmarks, image = get_landmarks(image_path, return_image=True)
 
         print(f"Successfully detected {len(landmarks)} landmarks!\n")
 
@@ -49,7 +49,7 @@ def main():
         # Optionally create visualization
         print("\n" + "-" * 60)
         output_path = image_path.rsplit('.', 1)[0] + '_annotated.jpg'
-        visualize_landmarks(image_path, landmarks, output_path)
+        visualize_landmarks(image, landmarks, output_path)
         print(f"Annotated image saved to: {output_path}")
 
     except FileNotFoundError as e:
@@ -6,19 +6,58 @@ Handles displaying instructions, collecting inputs, and presenting results.
 
 import sys
 import os
+import stat
 from pathlib import Path
 from typing import Optional, Tuple
 from datetime import datetime
 
+from utils import clear_screen, VALID_IMAGE_EXTENSIONS
 
-def clear_screen():
-    """Clear the console screen."""
-    os.system('clear' if os.name != 'nt' else 'cls')
+
+# Accepted yes/no answers; frozensets make each check a hashed lookup
+_YES = frozenset({'y', 'yes'})
+_NO = frozenset({'n', 'no'})
+
+
+def _prompt_yes_no(question: str) -> bool:
+    """
+    Ask a yes/no question until the user gives a recognizable answer.
+
+    Args:
+        question: Prompt shown to the user
+
+    Returns:
+        True for yes, False for no
+    """
+    while True:
+        response = input(question).strip().casefold()
+        if response in _YES:
+            return True
+        if response in _NO:
+            return False
+        print("Please enter 'yes' or 'no'")
+
+
+# Separator lines used throughout the UI, built once instead of
+# re-allocating the same 80-character string on every call
+_EQ80 = "=" * 80
+_DASH80 = "-" * 80
+_BANG80 = "!" * 80
+
+# print_separator memoizes any other (width, char) combination on first use
+_SEP_CACHE = {
+    (80, "="): _EQ80,
+    (80, "-"): _DASH80,
+    (80, "!"): _BANG80,
+}
 
 
 def print_separator(width: int = 80, char: str = "="):
     """Print a separator line."""
-    print(char * width)
+    line = _SEP_CACHE.get((width, char))
+    if line is None:
+        line = _SEP_CACHE.setdefault((width, char), char * width)
+    print(line)
 
 
 def print_header(title: str, width: int = 80):
@@ -28,14 +67,84 @@ def print_header(title: str, width: int = 80):
     print_separator(width)
 
 
+# Static screens are rendered once at import and written with a single
+# syscall each; per-line print() calls dominated display latency on
+# line-buffered terminals (one write per line)
+_WELCOME_TEXT = f"""{_EQ80}
+{'MFIT - Measurement Fit'.center(80)}
+{_EQ80}
+
+Body Measurement Capture System for Clothing Tailoring
+Analyzes front and side photos to calculate body dimensions
+
+Target Accuracy: ± 1.5 cm
+{_DASH80}
+"""
+
+_GUIDELINES_TEXT = f"""
+
+{_EQ80}
+{'PHOTOGRAPHY GUIDELINES - PLEASE READ CAREFULLY'.center(80)}
+{_EQ80}
+
+For accurate measurements, you MUST follow these guidelines:
+
+1. CLOTHING:
+   • Wear form-fitting athletic wear or compression clothing
+   • Leggings or tight pants preferred
+   • Avoid loose or baggy clothing
+
+2. POSE:
+   • Stand straight with good posture
+   • Neutral A-Pose: arms slightly away from body (about 15-30 degrees)
+   • Keep arms relaxed, not tense
+   • Look straight ahead
+
+3. CAMERA SETUP:
+   • Position camera at mid-torso height
+   • Keep camera level (not tilted up or down)
+   • Distance: 2-3 meters from subject
+   • Use timer or assistant to take photos
+
+4. FRAMING:
+   • Full body must be visible from head to feet
+   • Include small margin above head and below feet
+   • Center the person in the frame
+
+5. ENVIRONMENT:
+   • Plain, uncluttered background (wall preferred)
+   • Even, diffused lighting (avoid harsh shadows)
+   • Natural daylight or well-lit room
+
+6. TWO PHOTOS REQUIRED:
+   • FRONT VIEW: Face camera directly
+   • SIDE VIEW: Stand perpendicular (90°), left or right side
+
+{_DASH80}
+
+NOTE: All processing is done locally. Your photos are never uploaded
+      or transmitted. Images are discarded after the session ends.
+{_DASH80}
+"""
+
+_COMPLETION_TEXT = f"""
+
+{_EQ80}
+{'SESSION COMPLETE'.center(80)}
+{_EQ80}
+
+Thank you for using MFIT!
+All image data has been discarded from memory.
+{_DASH80}
+
+"""
+
+
 def display_welcome():
     """Display welcome message and application title."""
     clear_screen()
-    print_header("MFIT - Measurement Fit")
-    print("\nBody Measurement Capture System for Clothing Tailoring")
-    print("Analyzes front and side photos to calculate body dimensions")
-    print("\nTarget Accuracy: ± 1.5 cm")
-    print_separator(80, "-")
+    sys.stdout.write(_WELCOME_TEXT)
+    sys.stdout.flush()
 
 
 def display_guidelines():
@@ -45,45 +154,8 @@ def display_guidelines():
     These guidelines are critical for measurement accuracy and must be
     shown to the user before they proceed.
     """
-    print("\n")
-    print_header("PHOTOGRAPHY GUIDELINES - PLEASE READ CAREFULLY", 80)
-    print("\nFor accurate measurements, you MUST follow these guidelines:\n")
-
-    print("1. CLOTHING:")
-    print("   • Wear form-fitting athletic wear or compression clothing")
-    print("   • Leggings or tight pants preferred")
-    print("   • Avoid loose or baggy clothing\n")
-
-    print("2. POSE:")
-    print("   • Stand straight with good posture")
-    print("   • Neutral A-Pose: arms slightly away from body (about 15-30 degrees)")
-    print("   • Keep arms relaxed, not tense")
-    print("   • Look straight ahead\n")
-
-    print("3. CAMERA SETUP:")
-    print("   • Position camera at mid-torso height")
-    print("   • Keep camera level (not tilted up or down)")
-    print("   • Distance: 2-3 meters from subject")
-    print("   • Use timer or assistant to take photos\n")
-
-    print("4. FRAMING:")
-    print("   • Full body must be visible from head to feet")
-    print("   • Include small margin above head and below feet")
-    print("   • Center the person in the frame\n")
-
-    print("5. ENVIRONMENT:")
-    print("   • Plain, uncluttered background (wall preferred)")
-    print("   • Even, diffused lighting (avoid harsh shadows)")
-    print("   • Natural daylight or well-lit room\n")
-
-    print("6. TWO PHOTOS REQUIRED:")
-    print("   • FRONT VIEW: Face camera directly")
-    print("   • SIDE VIEW: Stand perpendicular (90°), left or right side\n")
-
-    print_separator(80, "-")
-    print("\nNOTE: All processing is done locally. Your photos are never uploaded")
-    print("      or transmitted. Images are discarded after the session ends.")
-    print_separator(80, "-")
+    sys.stdout.write(_GUIDELINES_TEXT)
+    sys.stdout.flush()
 
 
 def get_user_consent() -> bool:
@@ -95,14 +167,10 @@ def get_user_consent() -> bool:
     """
     print("\n")
     while True:
-        response = input("Have you read and understood the guidelines? (yes/no): ").strip().lower()
-        if response in ['yes', 'y']:
+        if _prompt_yes_no("Have you read and understood the guidelines? (yes/no): "):
             return True
-        elif response in ['no', 'n']:
-            print("\nPlease read the guidelines carefully before proceeding.")
-            print("Type 'yes' when ready to continue, or press Ctrl+C to exit.")
-        else:
-            print("Please enter 'yes' or 'no'")
+        print("\nPlease read the guidelines carefully before proceeding.")
+        print("Type 'yes' when ready to continue, or press Ctrl+C to exit.")
 
 
 def validate_image_path(path_str: str, photo_type: str) -> Tuple[bool, str]:
@@ -119,17 +187,23 @@ def validate_image_path(path_str: str, photo_type: str) -> Tuple[bool, str]:
     if not path_str or path_str.strip() == "":
         return False, "Path cannot be empty"
 
-    path = Path(path_str.strip())
+    path_str = path_str.strip()
 
-    if not path.exists():
+    # One os.stat covers the existence and regular-file checks that
+    # pathlib's exists()/is_file() would issue separate syscalls for
+    try:
+        st = os.stat(path_str)
+    except FileNotFoundError:
         return False, f"File not found: {path_str}"
+    except (OSError, ValueError):
+        # ValueError covers paths os.stat rejects outright (embedded NUL)
+        return False, f"Cannot access path: {path_str}"
 
-    if not path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         return False, f"Path is not a file: {path_str}"
 
-    valid_extensions = ['.jpg', '.jpeg', '.png']
-    if path.suffix.lower() not in valid_extensions:
-        return False, f"Unsupported format. Please use {', '.join(valid_extensions)}"
+    if os.path.splitext(path_str)[1].lower() not in VALID_IMAGE_EXTENSIONS:
+        return False, f"Unsupported format. Please use {', '.join(sorted(VALID_IMAGE_EXTENSIONS))}"
 
     return True, ""
 
@@ -180,12 +254,10 @@ def get_height() -> float:
 
             if height < 100 or height > 250:
                 print(f"  ⚠ Warning: {height} cm is outside typical range (100-250 cm)")
-                confirm = input("  Is this correct? (yes/no): ").strip().lower()
-                if confirm in ['yes', 'y']:
+                if _prompt_yes_no("  Is this correct? (yes/no): "):
                     return height
-                else:
-                    print("  Please enter your height again.")
-                    continue
+                print("  Please enter your height again.")
+                continue
 
             return height
 
@@ -205,28 +277,25 @@ def collect_inputs() -> Tuple[str, str, float]:
     print("INPUT COLLECTION".center(80))
     print_separator(80, "=")
 
-    front_path = get_image_path("front")
-    side_path = get_image_path("side")
-    height = get_height()
-
-    # Confirmation
-    print("\n")
-    print_separator(80, "-")
-    print("CONFIRMATION:")
-    print(f"  Front photo: {front_path}")
-    print(f"  Side photo:  {side_path}")
-    print(f"  Height:      {height} cm")
-    print_separator(80, "-")
-
+    # Iterative restart: looping instead of recursing keeps the stack flat
+    # no matter how often the user rejects the confirmation
     while True:
-        confirm = input("\nProceed with these inputs? (yes/no): ").strip().lower()
-        if confirm in ['yes', 'y']:
+        front_path = get_image_path("front")
+        side_path = get_image_path("side")
+        height = get_height()
+
+        # Confirmation
+        print("\n")
+        print_separator(80, "-")
+        print("CONFIRMATION:")
+        print(f"  Front photo: {front_path}")
+        print(f"  Side photo:  {side_path}")
+        print(f"  Height:      {height} cm")
+        print_separator(80, "-")
+
+        if _prompt_yes_no("\nProceed with these inputs? (yes/no): "):
             return front_path, side_path, height
-        elif confirm in ['no', 'n']:
-            print("\nRestarting input collection...")
-            return collect_inputs()
-        else:
-            print("Please enter 'yes' or 'no'")
+        print("\nRestarting input collection...")
 
 
 def display_processing():
@@ -239,6 +308,39 @@ def display_processing():
     print("This may take a few seconds...\n")
 
 
+# Whole report screen as one template: a single format_map call fills in the
+# pre-rendered value strings and one write puts the table on screen
+_PAD26 = " " * 26
+
+_MEASUREMENTS_TEMPLATE = f"""
+
+{_EQ80}
+{'BODY MEASUREMENTS REPORT'.center(80)}
+{_EQ80}
+
+Height: {{height}}
+
+┌─ LINEAR MEASUREMENTS {'─' * 56}┐
+│ Shoulder Width:              {{shoulder_width}}{_PAD26}│
+│ Left Sleeve Length:           {{left_sleeve_length}}{_PAD26}│
+│ Right Sleeve Length:          {{right_sleeve_length}}{_PAD26}│
+│ Inseam:                       {{inseam}}{_PAD26}│
+│ Outseam:                      {{outseam}}{_PAD26}│
+└{'─' * 78}┘
+
+┌─ CIRCUMFERENTIAL MEASUREMENTS {'─' * 47}┐
+│ Neck Circumference:           {{neck_circumference}}{_PAD26}│
+│ Chest Circumference:          {{chest_circumference}}{_PAD26}│
+│ Waist Circumference:          {{waist_circumference}}{_PAD26}│
+│ Hip Circumference:            {{hip_circumference}}{_PAD26}│
+│ Left Bicep Circumference:     {{left_bicep_circumference}}{_PAD26}│
+│ Right Bicep Circumference:    {{right_bicep_circumference}}{_PAD26}│
+│ Left Thigh Circumference:     {{left_thigh_circumference}}{_PAD26}│
+│ Right Thigh Circumference:    {{right_thigh_circumference}}{_PAD26}│
+└{'─' * 78}┘
+"""
+
+
 def display_measurements(measurements: dict):
     """
     Display all body measurements in a formatted table.
@@ -246,35 +348,70 @@ def display_measurements(measurements: dict):
     Args:
         measurements: Dictionary of measurements from calculator
     """
-    print("\n")
-    print_separator(80, "=")
-    print("BODY MEASUREMENTS REPORT".center(80))
-    print_separator(80, "=")
+    sys.stdout.write(_MEASUREMENTS_TEMPLATE.format_map(_render_measurements(measurements)))
+    sys.stdout.flush()
 
-    # Basic info
-    print(f"\nHeight: {measurements['height']:.1f} cm")
 
-    # Linear measurements
-    print("\n┌─ LINEAR MEASUREMENTS " + "─" * 56 + "┐")
-    print(f"│ Shoulder Width:              {measurements['shoulder_width']:6.1f} cm" + " " * 26 + "│")
-    print(f"│ Left Sleeve Length:           {measurements['left_sleeve_length']:6.1f} cm" + " " * 26 + "│")
-    print(f"│ Right Sleeve Length:          {measurements['right_sleeve_length']:6.1f} cm" + " " * 26 + "│")
-    print(f"│ Inseam:                       {measurements['inseam']:6.1f} cm" + " " * 26 + "│")
-    print(f"│ Outseam:                      {measurements['outseam']:6.1f} cm" + " " * 26 + "│")
-    print("└" + "─" * 78 + "┘")
+# Last (measurements, rendered) pair: the console report and the file export
+# format the same values the same way, so when the user saves right after
+# viewing, the rendered strings are reused instead of re-formatted
+_LAST_RENDER = None
 
-    # Circumferential measurements
-    print("\n┌─ CIRCUMFERENTIAL MEASUREMENTS " + "─" * 47 + "┐")
-    print(f"│ Neck Circumference:           {measurements['neck_circumference']:6.1f} cm" + " " * 26 + "│")
-    print(f"│ Chest Circumference:          {measurements['chest_circumference']:6.1f} cm" + " " * 26 + "│")
-    print(f"│ Waist Circumference:          {measurements['waist_circumference']:6.1f} cm" + " " * 26 + "│")
-    print(f"│ Hip Circumference:            {measurements['hip_circumference']:6.1f} cm" + " " * 26 + "│")
-    print(f"│ Left Bicep Circumference:     {measurements['left_bicep_circumference']:6.1f} cm" + " " * 26 + "│")
-    print(f"│ Right Bicep Circumference:    {measurements['right_bicep_circumference']:6.1f} cm" + " " * 26 + "│")
-    print(f"│ Left Thigh Circumference:     {measurements['left_thigh_circumference']:6.1f} cm" + " " * 26 + "│")
-    print(f"│ Right Thigh Circumference:    {measurements['right_thigh_circumference']:6.1f} cm" + " " * 26 + "│")
-    print("└" + "─" * 78 + "┘")
 
+def _render_measurements(measurements: dict) -> dict:
+    """
+    Pre-render every measurement value to its display string.
+
+    Args:
+        measurements: Dictionary of measurements from calculator
+
+    Returns:
+        Dictionary mapping measurement keys to rendered strings
+        (e.g. ' 104.5 cm')
+    """
+    global _LAST_RENDER
+    if _LAST_RENDER is not None and _LAST_RENDER[0] is measurements:
+        return _LAST_RENDER[1]
+
+    rendered = {
+        key: f"{value:.1f} cm" if key == 'height' else f"{value:6.1f} cm"
+        for key, value in measurements.items()
+    }
+    _LAST_RENDER = (measurements, rendered)
+    return rendered
+
+# Whole export file as one template: a single format_map call renders it
+# without the per-line appends, allocations and re-parsed format specs
+_FILE_REPORT_TEMPLATE = f"""{_EQ80}
+MFIT - BODY MEASUREMENTS REPORT
+{_EQ80}
+
+Generated: {{generated}}
+
+Height: {{height}}
+
+--- LINEAR MEASUREMENTS ---
+Shoulder Width:              {{shoulder_width}}
+Left Sleeve Length:           {{left_sleeve_length}}
+Right Sleeve Length:          {{right_sleeve_length}}
+Inseam:                       {{inseam}}
+Outseam:                      {{outseam}}
+
+--- CIRCUMFERENTIAL MEASUREMENTS ---
+Neck Circumference:           {{neck_circumference}}
+Chest Circumference:          {{chest_circumference}}
+Waist Circumference:          {{waist_circumference}}
+Hip Circumference:            {{hip_circumference}}
+Left Bicep Circumference:     {{left_bicep_circumference}}
+Right Bicep Circumference:    {{right_bicep_circumference}}
+Left Thigh Circumference:     {{left_thigh_circumference}}
+Right Thigh Circumference:    {{right_thigh_circumference}}
+
+{_EQ80}
+DISCLAIMER:
+These measurements are estimates. Accuracy depends on photo quality.
+For best results, follow all guidelines carefully.
+{_EQ80}"""
 
 
 def format_measurements_for_file(measurements: dict) -> str:
@@ -287,37 +424,10 @@ def format_measurements_for_file(measurements: dict) -> str:
     Returns:
         Formatted string for file output
     """
-    lines = []
-    lines.append("=" * 80)
-    lines.append("MFIT - BODY MEASUREMENTS REPORT")
-    lines.append("=" * 80)
-    lines.append(f"\nGenerated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    lines.append(f"\nHeight: {measurements['height']:.1f} cm")
-
-    lines.append("\n--- LINEAR MEASUREMENTS ---")
-    lines.append(f"Shoulder Width:              {measurements['shoulder_width']:6.1f} cm")
-    lines.append(f"Left Sleeve Length:           {measurements['left_sleeve_length']:6.1f} cm")
-    lines.append(f"Right Sleeve Length:          {measurements['right_sleeve_length']:6.1f} cm")
-    lines.append(f"Inseam:                       {measurements['inseam']:6.1f} cm")
-    lines.append(f"Outseam:                      {measurements['outseam']:6.1f} cm")
-
-    lines.append("\n--- CIRCUMFERENTIAL MEASUREMENTS ---")
-    lines.append(f"Neck Circumference:           {measurements['neck_circumference']:6.1f} cm")
-    lines.append(f"Chest Circumference:          {measurements['chest_circumference']:6.1f} cm")
-    lines.append(f"Waist Circumference:          {measurements['waist_circumference']:6.1f} cm")
-    lines.append(f"Hip Circumference:            {measurements['hip_circumference']:6.1f} cm")
-    lines.append(f"Left Bicep Circumference:     {measurements['left_bicep_circumference']:6.1f} cm")
-    lines.append(f"Right Bicep Circumference:    {measurements['right_bicep_circumference']:6.1f} cm")
-    lines.append(f"Left Thigh Circumference:     {measurements['left_thigh_circumference']:6.1f} cm")
-    lines.append(f"Right Thigh Circumference:    {measurements['right_thigh_circumference']:6.1f} cm")
-
-    lines.append("\n" + "=" * 80)
-    lines.append("DISCLAIMER:")
-    lines.append("These measurements are estimates. Accuracy depends on photo quality.")
-    lines.append("For best results, follow all guidelines carefully.")
-    lines.append("=" * 80)
-
-    return "\n".join(lines)
+    return _FILE_REPORT_TEMPLATE.format_map(
+        {'generated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+         **_render_measurements(measurements)}
+    )
 
 
 def export_measurements(measurements: dict) -> Optional[str]:
@@ -333,15 +443,8 @@ def export_measurements(measurements: dict) -> Optional[str]:
     print("\n")
     print_separator(80, "-")
 
-    while True:
-        response = input("Would you like to save these measurements to a file? (yes/no): ").strip().lower()
-
-        if response in ['no', 'n']:
-            return None
-        elif response in ['yes', 'y']:
-            break
-        else:
-            print("Please enter 'yes' or 'no'")
+    if not _prompt_yes_no("Would you like to save these measurements to a file? (yes/no): "):
+        return None
 
     # Get filename
     default_filename = f"measurements_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
@@ -359,8 +462,7 @@ def export_measurements(measurements: dict) -> Optional[str]:
 
         # Check if file exists
         if Path(filename).exists():
-            overwrite = input(f"File '{filename}' already exists. Overwrite? (yes/no): ").strip().lower()
-            if overwrite not in ['yes', 'y']:
+            if not _prompt_yes_no(f"File '{filename}' already exists. Overwrite? (yes/no): "):
                 print("Please enter a different filename.")
                 continue
 
@@ -371,8 +473,7 @@ def export_measurements(measurements: dict) -> Optional[str]:
             return filename
         except Exception as e:
             print(f"\n✗ Error saving file: {e}")
-            retry = input("Try again with a different filename? (yes/no): ").strip().lower()
-            if retry not in ['yes', 'y']:
+            if not _prompt_yes_no("Try again with a different filename? (yes/no): "):
                 return None
 
 
@@ -394,11 +495,5 @@ def display_error(error_message: str, error_type: str = "Error"):
 
 def display_completion():
     """Display completion message."""
-    print("\n")
-    print_separator(80, "=")
-    print("SESSION COMPLETE".center(80))
-    print_separator(80, "=")
-    print("\nThank you for using MFIT!")
-    print("All image data has been discarded from memory.")
-    print_separator(80, "-")
-    print()
+    sys.stdout.write(_COMPLETION_TEXT)
+    sys.stdout.flush()
@@ -6,22 +6,70 @@ Contains helper functions used across multiple modules.
 
 import math
 import os
+import stat
+import sys
 from typing import Tuple, List
 from pathlib import Path
 
+# Supported image extensions; frozenset makes the membership check a
+# hashed O(1) lookup
+VALID_IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png'})
 
-def euclidean_distance(p1: Tuple[float, float], p2: Tuple[float, float]) -> float:
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is an optional accelerator; without it the scalar kernel below
+    # simply runs interpreted.
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+
+@njit(cache=True, fastmath=True)
+def _distance_scalar(p1x: float, p1y: float, p2x: float, p2y: float) -> float:
+    """Scalar distance kernel; takes four floats to avoid tuple boxing."""
+    return math.hypot(p2x - p1x, p2y - p1y)
+
+
+# Pay the (cached) compile cost at import rather than on the first real call
+_distance_scalar(0.0, 0.0, 1.0, 1.0)
+
+
+def euclidean_distance(p1, p2):
     """
     Calculate Euclidean distance between two points.
 
+    Also accepts (N, 2) point arrays, in which case the N distances are
+    computed in one vectorized pass instead of N interpreted calls.
+
     Args:
-        p1: First point as (x, y) tuple
-        p2: Second point as (x, y) tuple
+        p1: First point as (x, y) tuple, or (N, 2) array of points
+        p2: Second point as (x, y) tuple, or (N, 2) array of points
 
     Returns:
-        Distance between the points
+        Distance between the points (array of distances for array inputs)
     """
-    return math.sqrt((p2[0] - p1[0]) ** 2 + (p2[1] - p1[1]) ** 2)
+    if isinstance(p1, np.ndarray) or isinstance(p2, np.ndarray):
+        return euclidean_distance_batch(p1, p2)
+    return _distance_scalar(p1[0], p1[1], p2[0], p2[1])
+
+
+def euclidean_distance_batch(p1: np.ndarray, p2: np.ndarray) -> np.ndarray:
+    """
+    Vectorized Euclidean distance between two (N, 2) point arrays.
+
+    Args:
+        p1: First points as an (N, 2) array
+        p2: Second points as an (N, 2) array
+
+    Returns:
+        Array of N distances
+    """
+    diff = np.subtract(p2, p1)
+    return np.hypot(diff[..., 0], diff[..., 1])
 
 
 def validate_image_path(image_path: str) -> bool:
@@ -34,15 +82,17 @@ def validate_image_path(image_path: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    path = Path(image_path)
-
-    if not path.exists():
+    # One os.stat covers the existence and regular-file checks that
+    # pathlib's exists()/is_file() would issue separate syscalls for
+    try:
+        st = os.stat(image_path)
+    except (OSError, ValueError):
         return False
 
-    if path.suffix.lower() not in ['.jpg', '.jpeg', '.png']:
+    if not stat.S_ISREG(st.st_mode):
         return False
 
-    return True
+    return os.path.splitext(image_path)[1].lower() in VALID_IMAGE_EXTENSIONS
 
 
 def validate_height(height_cm: float) -> bool:
@@ -73,25 +123,37 @@ def format_measurement(value: float, unit: str = "cm", decimal_places: int = 1)
     return f"{value:.{decimal_places}f} {unit}"
 
 
-def get_midpoint(p1: Tuple[float, float], p2: Tuple[float, float]) -> Tuple[float, float]:
+def get_midpoint(p1, p2):
     """
     Calculate the midpoint between two points.
 
+    Also accepts (N, 2) point arrays, returning the N midpoints as an array.
+
     Args:
-        p1: First point as (x, y) tuple
-        p2: Second point as (x, y) tuple
+        p1: First point as (x, y) tuple, or (N, 2) array of points
+        p2: Second point as (x, y) tuple, or (N, 2) array of points
 
     Returns:
-        Midpoint as (x, y) tuple
+        Midpoint as (x, y) tuple (array of midpoints for array inputs)
     """
+    if isinstance(p1, np.ndarray) or isinstance(p2, np.ndarray):
+        return (np.asarray(p1) + np.asarray(p2)) * 0.5
     return ((p1[0] + p2[0]) / 2, (p1[1] + p2[1]) / 2)
 
 
 def clear_screen():
     """
     Clear the console screen.
+
+    Writes the ANSI clear+home escape sequence directly instead of forking
+    a shell for clear/cls, which costs a full process creation per call.
+    Legacy Windows consoles without ANSI support keep the cls fallback.
     """
-    os.system('clear' if os.name != 'nt' else 'cls')
+    if os.name != 'nt':
+        sys.stdout.write("\x1b[2J\x1b[H")
+        sys.stdout.flush()
+    else:
+        os.system('cls')
 
 
 def print_header(title: str, width: int = 70):